@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import random
-import plotly.express as px
+import numpy as np
+import uuid
 
 
 # PAGE CONFIGURATION
@@ -17,6 +17,8 @@ st.set_page_config(
 # CONSTANTS AND SAMPLE DATA
 
 CATEGORIES = ['Electronics', 'Clothing', 'Grocery', 'Stationery', 'Sports']
+STATUS_LEVELS = ['In Stock', 'Low Stock']
+CHART_CACHE_ENTRIES = 100
 PRODUCT_NAMES = [
     'Phone', 'T-Shirt', 'Bread', 'Notebook', 'Football',
     'Laptop', 'Jeans', 'Milk', 'Pen', 'Tennis Ball',
@@ -27,31 +29,47 @@ PRODUCT_NAMES = [
 
 # DATA MANAGEMENT FUNCTIONS
 
+def build_inventory(product_ids=(), names=(), categories=(), quantities=(), reorder_levels=()):
+    """Build a typed, column-oriented inventory DataFrame"""
+    return pd.DataFrame({
+        'ProductID': pd.array(product_ids, dtype='string'),
+        'Name': pd.array(names, dtype='string'),
+        'Category': pd.Categorical(categories, categories=CATEGORIES),
+        'QuantityAvailable': pd.array(quantities, dtype='int32'),
+        'ReorderLevel': pd.array(reorder_levels, dtype='int32')
+    })
+
 def generate_sample_data(num_items=20):
     """Generate sample inventory data"""
-    data = []
-    for i in range(1, num_items + 1):
-        category = random.choice(CATEGORIES)
-        name = f"{random.choice(PRODUCT_NAMES)}-{random.randint(100, 999)}"
-        quantity = random.randint(0, 100)
-        reorder_level = random.randint(5, 30)
-        
-        data.append({
-            'ProductID': f"P{i:03d}",
-            'Name': name,
-            'Category': category,
-            'QuantityAvailable': quantity,
-            'ReorderLevel': reorder_level,
-            'Status': 'Low Stock' if quantity <= reorder_level else 'In Stock'
-        })
-    return data
+    rng = np.random.default_rng()
+    categories = rng.choice(CATEGORIES, num_items)
+    name_idx = rng.choice(len(PRODUCT_NAMES), num_items)
+    suffixes = rng.integers(100, 1000, num_items)
+    quantities = rng.integers(0, 101, num_items)
+    reorder_levels = rng.integers(5, 31, num_items)
+    
+    return build_inventory(
+        product_ids=[f"P{i:03d}" for i in range(1, num_items + 1)],
+        names=[f"{PRODUCT_NAMES[i]}-{s}" for i, s in zip(name_idx, suffixes)],
+        categories=categories,
+        quantities=quantities,
+        reorder_levels=reorder_levels
+    )
 
 def initialize_data():
     """Initialize or load inventory data"""
-    if 'data' not in st.session_state:
-        st.session_state.data = generate_sample_data()
+    if 'df' not in st.session_state:
+        st.session_state.df = generate_sample_data()
     if 'next_id' not in st.session_state:
-        st.session_state.next_id = len(st.session_state.data) + 1
+        st.session_state.next_id = len(st.session_state.df) + 1
+    if 'data_version' not in st.session_state:
+        # Token + counter identify this session's data in the shared chart cache
+        st.session_state.session_token = uuid.uuid4().hex
+        st.session_state.data_version = 0
+
+def data_key():
+    """Cheap cache key for the current inventory, bumped on every mutation"""
+    return (st.session_state.session_token, st.session_state.data_version)
 
 
 # SIDEBAR - PRODUCT MANAGEMENT
@@ -94,13 +112,15 @@ def render_sidebar():
         # Data management options
         with st.expander("⚙️ Data Options"):
             if st.button("🔄 Generate Sample Data"):
-                st.session_state.data = generate_sample_data()
-                st.session_state.next_id = len(st.session_state.data) + 1
+                st.session_state.df = generate_sample_data()
+                st.session_state.next_id = len(st.session_state.df) + 1
+                st.session_state.data_version += 1
                 st.rerun()
                 
             if st.button("🗑️ Clear All Data"):
-                st.session_state.data = []
+                st.session_state.df = build_inventory()
                 st.session_state.next_id = 1
+                st.session_state.data_version += 1
                 st.rerun()
 
 def add_product(product_id, name, category, quantity, reorder_level):
@@ -109,17 +129,17 @@ def add_product(product_id, name, category, quantity, reorder_level):
         st.error("Please enter a product name")
         return
         
-    new_product = {
-        'ProductID': product_id,
-        'Name': name,
-        'Category': category,
-        'QuantityAvailable': quantity,
-        'ReorderLevel': reorder_level,
-        'Status': 'Low Stock' if quantity <= reorder_level else 'In Stock'
-    }
+    new_product = build_inventory(
+        product_ids=[product_id],
+        names=[name],
+        categories=[category],
+        quantities=[quantity],
+        reorder_levels=[reorder_level]
+    )
     
-    st.session_state.data.append(new_product)
+    st.session_state.df = pd.concat([st.session_state.df, new_product], ignore_index=True)
     st.session_state.next_id += 1
+    st.session_state.data_version += 1
     st.success(f"Product '{name}' added successfully!")
     st.rerun()
 
@@ -131,33 +151,36 @@ def render_dashboard():
     st.title("📦 Inventory Management Dashboard")
     st.markdown("---")
     
-    # Convert data to DataFrame
-    df = pd.DataFrame(st.session_state.data)
+    df = st.session_state.df
     
     if df.empty:
         st.warning("No inventory data available. Please add products or generate sample data.")
         return
     
+    # Low stock is derived from the stored columns in one vectorized compare
+    low_mask = df['QuantityAvailable'] <= df['ReorderLevel']
+    cat_options = df['Category'].unique().tolist()
+    
     # Summary cards
-    render_summary_cards(df)
+    render_summary_cards(df, low_mask, cat_options)
     
     # Main content columns
     col1, col2 = st.columns([2, 3])
     
     with col1:
-        render_inventory_table(df)
+        render_inventory_table(df, low_mask, cat_options)
         
     with col2:
-        render_category_charts(df)
+        render_category_charts(df, low_mask)
     
 
 
-def render_summary_cards(df):
+def render_summary_cards(df, low_mask, cat_options):
     """Render summary KPI cards"""
     total_items = len(df)
     total_quantity = df['QuantityAvailable'].sum()
-    low_stock_count = len(df[df['QuantityAvailable'] <= df['ReorderLevel']])
-    categories_count = df['Category'].nunique()
+    low_stock_count = int(low_mask.sum())
+    categories_count = len(cat_options)
     
     cols = st.columns(4)
     cols[0].metric("Total Products", total_items)
@@ -165,7 +188,11 @@ def render_summary_cards(df):
     cols[2].metric("Low Stock Items", low_stock_count, delta_color="inverse")
     cols[3].metric("Categories", categories_count)
 
-def render_inventory_table(df):
+def color_status(col):
+    """Return a text color for every cell of the Status column"""
+    return np.where(col.to_numpy() == 'Low Stock', 'color: red', 'color: green')
+
+def render_inventory_table(df, low_mask, cat_options):
     """Render the inventory table with filters"""
     with st.container():
         st.subheader("📋 Inventory Overview")
@@ -175,86 +202,109 @@ def render_inventory_table(df):
         with col1:
             category_filter = st.multiselect(
                 "Filter by Category",
-                options=df['Category'].unique(),
-                default=df['Category'].unique()
+                options=cat_options,
+                default=cat_options
             )
         with col2:
-            status_filter = st.multiselect(
-                "Filter by Status",
-                options=['In Stock', 'Low Stock'],
-                default=['In Stock', 'Low Stock']
-            )
+            low_stock_only = st.checkbox("Show low stock only")
         
         # Apply filters
-        filtered_df = df[
-            (df['Category'].isin(category_filter)) & 
-            (df['Status'].isin(status_filter))
-        ]
+        row_mask = df['Category'].isin(category_filter)
+        if low_stock_only:
+            row_mask &= low_mask
+        filtered_df = df[row_mask].assign(
+            Status=pd.Categorical.from_codes(
+                low_mask[row_mask].to_numpy().astype(np.int8),
+                categories=STATUS_LEVELS
+            )
+        )
         
         # Display table with conditional formatting
         st.dataframe(
-            filtered_df.style.applymap(
-                lambda x: 'color: red' if x == 'Low Stock' else 'color: green',
-                subset=['Status']
-            ),
+            filtered_df.style.apply(color_status, subset=['Status']),
             use_container_width=True,
             height=600
         )
 
-def render_category_charts(df):
+# Cached chart helpers are keyed on data_key(); the leading underscore
+# tells Streamlit not to hash the DataFrame argument itself. Keys never
+# repeat after a mutation, so the caches are bounded to evict stale entries
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def category_totals(key, _df):
+    """Total quantity per category"""
+    return _df.groupby('Category', observed=True)['QuantityAvailable'].sum().reset_index()
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def category_pie_chart(key, _totals):
+    """Pie chart of stock proportion by category"""
+    import plotly.express as px
+    
+    fig = px.pie(
+        _totals,
+        values='QuantityAvailable',
+        names='Category',
+        hole=0.3,
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def category_bar_chart(key, _totals):
+    """Bar chart of total quantity by category"""
+    import plotly.express as px
+    
+    fig = px.bar(
+        _totals,
+        x='Category',
+        y='QuantityAvailable',
+        color='Category',
+        text_auto=True,
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+def render_category_charts(df, low_mask):
     """Render category distribution charts"""
     with st.container():
         tab1, tab2, tab3 = st.tabs(["📊 Stock Distribution", "📈 Quantity by Category", "🚨 Low Stock Alerts"])
+        key = data_key()
+        totals = category_totals(key, df)
         
         with tab1:
             st.subheader("Stock Proportion by Category")
-            category_proportion = df.groupby('Category')['QuantityAvailable'].sum().reset_index()
-            fig = px.pie(
-                category_proportion,
-                values='QuantityAvailable',
-                names='Category',
-                hole=0.3,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(category_pie_chart(key, totals), use_container_width=True)
             
         with tab2:
             st.subheader("Total Quantity by Category")
-            category_counts = df.groupby('Category')['QuantityAvailable'].sum().reset_index()
-            fig = px.bar(
-                category_counts,
-                x='Category',
-                y='QuantityAvailable',
-                color='Category',
-                text_auto=True,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            fig.update_layout(showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(category_bar_chart(key, totals), use_container_width=True)
         
         with tab3:
-            render_alerts_section(df)
+            render_alerts_section(df[low_mask])
 
-def render_alerts_section(df):
+def render_alerts_section(low_stock):
     """Render low stock alerts section"""
     st.markdown("---")
     st.subheader("🚨 Low Stock Alerts")
     
-    low_stock = df[df['Status'] == 'Low Stock']
-    
     if not low_stock.empty:
         # Create columns for each low stock item
         cols = st.columns(3)
-        for idx, (_, row) in enumerate(low_stock.iterrows()):
+        names = low_stock['Name'].to_numpy()
+        product_ids = low_stock['ProductID'].to_numpy()
+        categories = low_stock['Category'].to_numpy()
+        quantities = low_stock['QuantityAvailable'].to_numpy()
+        reorder_levels = low_stock['ReorderLevel'].to_numpy()
+        for idx in range(len(low_stock)):
             with cols[idx % 3]:
                 with st.container(border=True):
-                    st.markdown(f"**{row['Name']}** ({row['ProductID']})")
+                    st.markdown(f"**{names[idx]}** ({product_ids[idx]})")
                     st.progress(
-                        row['QuantityAvailable'] / row['ReorderLevel'],
-                        text=f"{row['QuantityAvailable']}/{row['ReorderLevel']} units remaining"
+                        quantities[idx] / reorder_levels[idx],
+                        text=f"{quantities[idx]}/{reorder_levels[idx]} units remaining"
                     )
-                    st.caption(f"Category: {row['Category']}")
+                    st.caption(f"Category: {categories[idx]}")
     else:
         st.success("🎉 All products are sufficiently stocked!")
 
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 import io
 
 # Set page configuration
@@ -10,6 +12,82 @@ st.set_page_config(
     layout="wide"
 )
 
+# Strings pandas reads as missing by default, passed to PyArrow so both parsers agree
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+]
+
+# CSV parsing helper
+def read_csv(file_bytes):
+    """Stream a CSV through PyArrow in record batches, downcasting each batch as it arrives"""
+    convert_options = pa_csv.ConvertOptions(null_values=NA_VALUES, strings_can_be_null=True)
+    try:
+        reader = pa_csv.open_csv(io.BytesIO(file_bytes), convert_options=convert_options)
+        # Categories are decided once all batches are in, since per-batch ones would not line up
+        frames = [optimize_dtypes(batch.to_pandas(), categorize=False) for batch in reader]
+    except pa.ArrowInvalid:
+        # Column types come from the first block; if a later block disagrees, parse in one go
+        return pd.read_csv(io.BytesIO(file_bytes))
+    if not frames:
+        return reader.schema.empty_table().to_pandas()
+    return pd.concat(frames, ignore_index=True)
+
+# Memory optimization helpers
+def _shrink_column(col, categorize=True):
+    """Downcast a column to the smallest dtype that holds its values"""
+    if pd.api.types.is_integer_dtype(col):
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if col.min() >= info.min and col.max() <= info.max:
+                return col.astype(dtype)
+    elif pd.api.types.is_float_dtype(col):
+        # Only downcast when every value survives the float32 round-trip exactly
+        info = np.finfo(np.float32)
+        if col.min() >= info.min and col.max() <= info.max:
+            downcast = col.astype(np.float32)
+            if np.array_equal(downcast.to_numpy(dtype=col.dtype), col.to_numpy(), equal_nan=True):
+                return downcast
+    elif categorize and col.dtype == object and len(col) > 0 and col.nunique() / len(col) < 0.5:
+        return col.astype("category")
+    return col
+
+def optimize_dtypes(df, categorize=True):
+    """Shrink numeric columns and turn low-cardinality text columns into categories"""
+    return df.apply(_shrink_column, categorize=categorize)
+
+def restore_float64(df):
+    """Widen float32 columns back to float64 so computed and written values keep full precision"""
+    return df.astype({col: np.float64 for col, dtype in df.dtypes.items() if dtype == np.float32})
+
+# Fused mean + fill kernel, compiled with Numba when it is installed
+def load_mean_fillna():
+    """Import the Numba mean + fill kernel, or return None if Numba is unavailable"""
+    try:
+        from fill_kernels import mean_fillna
+    except ImportError:
+        return None
+    return mean_fillna
+
+# Mode helper: one hash-based value_counts per column that actually has gaps
+def column_modes(df):
+    """Most frequent value of each column with missing values"""
+    modes = {}
+    for col, values in df.items():
+        if values.hasnans:
+            counts = values.value_counts()
+            if len(counts) > 0 and counts.iloc[0] > 0:
+                modes[col] = counts.index[0]
+    return modes
+
+# Cached helper so widget interactions don't re-parse the same upload; entries are
+# whole datasets shared across sessions, so keep only a few recent ones for an hour
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
+def load_csv(file_bytes):
+    """Parse and optimize the uploaded CSV once per file, with its missing-value counts"""
+    df = optimize_dtypes(read_csv(file_bytes))
+    return df, df.isnull().sum()
+
 # App title and description
 st.title("🧹 Missing Data Cleaner")
 st.markdown("""
@@ -28,14 +106,13 @@ with st.sidebar:
         st.success("File uploaded successfully!")
         
         # Read the dataset
-        df = pd.read_csv(uploaded_file)
+        df, missing_values = load_csv(uploaded_file.getvalue())
         
         # Show dataset info
         st.subheader("Dataset Info")
         st.write(f"Shape: {df.shape[0]} rows, {df.shape[1]} columns")
         
         # Count missing values
-        missing_values = df.isnull().sum()
         st.write("Missing values per column:")
         for col, count in missing_values.items():
             if count > 0:
@@ -61,44 +138,52 @@ if uploaded_file is not None:
     
     # Show missing values heatmap
     st.subheader("Missing Values Visualization")
-    try:
-        import missingno as msno
-        import matplotlib.pyplot as plt
+    if not df.empty:
+        import plotly.express as px
         
-        fig, ax = plt.subplots()
-        msno.matrix(df, ax=ax)
-        st.pyplot(fig)
-    except ImportError:
-        st.info("Install 'missingno' for missing data visualization: pip install missingno")
+        # Present cells are white, missing cells black; sent as one PNG rather than per-cell JSON
+        present_mask = df.notnull().to_numpy().astype(np.uint8)
+        fig = px.imshow(
+            present_mask,
+            binary_string=True,
+            zmin=0,
+            zmax=1,
+            aspect="auto",
+            labels={"x": "Column", "y": "Row"}
+        )
+        fig.update_xaxes(
+            tickmode="array",
+            tickvals=list(range(df.shape[1])),
+            ticktext=[str(col) for col in df.columns]
+        )
+        st.plotly_chart(fig, use_container_width=True)
     
     # Clean data button
     if st.button("🪄 Clean Data", type="primary"):
-        # Create a copy of the dataframe
-        cleaned_df = df.copy()
+        # Fill and export at float64 so fill values and the downloaded CSV match the upload
+        df = restore_float64(df)
         
-        # Determine which columns to process
-        if exclude_cols:
-            # Only numeric columns
-            numeric_cols = cleaned_df.select_dtypes(include=[np.number]).columns
-            cols_to_process = numeric_cols
+        mean_fillna = load_mean_fillna() if fill_method == "Mean" else None
+        if mean_fillna is not None:
+            # Only float columns can hold NaN among numeric ones; fill them in one fused pass
+            float_cols = df.select_dtypes(include="floating").columns
+            values = np.asfortranarray(df[float_cols].to_numpy(dtype=np.float64))
+            mean_fillna(values)
+            cleaned_df = df.copy()
+            cleaned_df[float_cols] = pd.DataFrame(values, index=df.index, columns=float_cols)
         else:
-            # All columns
-            cols_to_process = cleaned_df.columns
-        
-        # Fill missing values based on selected method
-        for col in cols_to_process:
-            if cleaned_df[col].isnull().sum() > 0:
-                if fill_method == "Mean" and pd.api.types.is_numeric_dtype(cleaned_df[col]):
-                    filled_value = cleaned_df[col].mean()
-                elif fill_method == "Median" and pd.api.types.is_numeric_dtype(cleaned_df[col]):
-                    filled_value = cleaned_df[col].median()
-                elif fill_method == "Mode":
-                    filled_value = cleaned_df[col].mode()[0] if not cleaned_df[col].mode().empty else None
-                else:
-                    filled_value = None
-                
-                if filled_value is not None:
-                    cleaned_df[col].fillna(filled_value, inplace=True)
+            # Pandas path: median/mode, or mean when Numba is not installed
+            # Compute one fill value per column; mean and median only apply to numeric columns
+            if fill_method == "Mean":
+                fill_values = df.mean(numeric_only=True)
+            elif fill_method == "Median":
+                fill_values = df.median(numeric_only=True)
+            else:
+                # Excluding non-numeric columns restricts the mode to numeric ones
+                fill_values = column_modes(df.select_dtypes(include=np.number) if exclude_cols else df)
+            
+            # Fill missing values in a single vectorized pass (returns a new dataframe)
+            cleaned_df = df.fillna(fill_values)
         
         # Display cleaned dataset
         st.header("Cleaned Dataset")
@@ -115,13 +200,14 @@ if uploaded_file is not None:
         if save_option:
             st.subheader("Download Cleaned Data")
             
-            # Convert dataframe to CSV
-            csv = cleaned_df.to_csv(index=False)
+            # Write the CSV straight into a bytes buffer
+            csv_buffer = io.BytesIO()
+            cleaned_df.to_csv(csv_buffer, index=False)
             
             # Create download button
             st.download_button(
                 label="Download cleaned CSV",
-                data=csv,
+                data=csv_buffer.getvalue(),
                 file_name="cleaned_dataset.csv",
                 mime="text/csv"
             )
@@ -0,0 +1,21 @@
+# Numba kernels for app.py, imported lazily so Numba only loads when a mean fill runs
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def mean_fillna(values):
+    """Replace NaNs in each column of a 2D float array with that column's mean, in place"""
+    n_rows, n_cols = values.shape
+    for j in prange(n_cols):
+        total = 0.0
+        count = 0
+        for i in range(n_rows):
+            v = values[i, j]
+            if not np.isnan(v):
+                total += v
+                count += 1
+        mean = total / count if count else np.nan
+        for i in range(n_rows):
+            if np.isnan(values[i, j]):
+                values[i, j] = mean